@@ -5,9 +5,19 @@ Handles CSVs with no header row, FileMaker IDs as primary keys
 """
 
 import csv
+import mmap
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+try:
+    # Optional: much faster CSV parsing for large exports, falls back to the csv module
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -16,19 +26,43 @@ DATA_DIR = PROJECT_DIR / "data"
 DB_PATH = PROJECT_DIR / "poetry.db"
 SCHEMA_PATH = PROJECT_DIR / "schema.sql"
 
+# INSERT statements (without VALUES - chunked_insert appends the row placeholders)
+SQL_INSERT_ITEMS = (
+    "INSERT OR IGNORE INTO items (item_id, word, type, definition, derivation, "
+    "appendicies, source, source_pg, mark, modified_at)"
+)
+# link_type is left to its schema default ('related')
+SQL_INSERT_LINKS = "INSERT OR IGNORE INTO links (link_id, source_item_id, destination_item_id)"
+SQL_INSERT_CLICHES = "INSERT OR IGNORE INTO cliches (cliche_id, phrase, definition)"
+SQL_INSERT_NAMES = "INSERT OR IGNORE INTO names (name_id, name, type, gender, description, notes)"
+SQL_INSERT_LITERARY_TERMS = (
+    "INSERT OR IGNORE INTO literary_terms (term_id, term, type, definition, examples, notes)"
+)
+SQL_INSERT_SOURCES = "INSERT OR IGNORE INTO sources (title, author, notes)"
+
+# Read buffer for CSV files (the 8 KiB default means many small reads on large exports)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Per-table cap on the row error messages shown (the rest are only counted)
+MAX_ERROR_SAMPLES = 5
+
+# FileMaker paragraph symbol and vertical tab (\x0b) become newlines,
+# Unicode replacement character becomes a standard double quote
+_CLEAN_MAP = str.maketrans({'¶': '\n', '\x0b': '\n', '\ufffd': '"'})
+# Every character clean_text rewrites
+_CLEAN_SET = frozenset('¶\x0b\r\ufffd')
+
 def clean_text(text):
     """Clean text fields - replace FileMaker paragraph markers and special characters"""
     if not text:
         return None
-    # Replace FileMaker paragraph symbol with newlines
-    text = text.replace('¶', '\n')
-    # Replace vertical tab (\x0b) with newlines
-    text = text.replace('\x0b', '\n')
-    # Replace carriage returns
-    text = text.replace('\r\n', '\n')
-    text = text.replace('\r', '\n')
-    # Replace Unicode replacement character with standard double quote
-    text = text.replace('\ufffd', '"')
+    # Most fields have nothing to replace - skip straight to the strip
+    if _CLEAN_SET.isdisjoint(text):
+        text = text.strip()
+        return text if text else None
+    text = text.translate(_CLEAN_MAP)
+    # Replace carriage returns (after the translate, so '\r' + '¶' still collapses to one newline)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
     text = text.strip()
     return text if text else None
 
@@ -41,322 +75,389 @@ def create_database():
         DB_PATH.unlink()
         print("  Removed existing database")
     
-    # Create new database
-    conn = sqlite3.connect(DB_PATH)
-    
+    # Build the database in memory (autocommit mode - transactions are managed explicitly);
+    # main() writes it to DB_PATH in one pass once everything is loaded
+    conn = sqlite3.connect(':memory:', isolation_level=None, cached_statements=256)
+
+    # Bulk-load settings - safe because the database is rebuilt from scratch on every run
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
     # Load and execute schema
     with open(SCHEMA_PATH, 'r') as f:
         schema = f.read()
         conn.executescript(schema)
     
     print("  Database schema created")
+    
+    # Run the whole import inside one transaction, committed once in main()
+    conn.execute("BEGIN")
     return conn
 
-def import_items(conn, csv_path):
-    """Import items from CSV (no header row)"""
-    print(f"\nImporting items from {csv_path}")
-    
-    if not csv_path.exists():
-        print(f"  File not found: {csv_path}")
-        return
-    
-    cursor = conn.cursor()
-    count = 0
-    errors = 0
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
-            try:
-                if len(row) < 10:
-                    print(f"  Skipping row with insufficient columns: {len(row)}")
-                    errors += 1
-                    continue
-                
-                item_id = int(row[0]) if row[0] else None
-                if not item_id:
-                    print(f"  Skipping row with missing ID")
-                    errors += 1
-                    continue
-                
-                cursor.execute("""
-                    INSERT OR IGNORE INTO items (
-                        item_id, word, type, definition, derivation,
-                        appendicies, source, source_pg, mark, modified_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    item_id,
-                    row[1] if len(row) > 1 else '',
-                    row[2] if len(row) > 2 else 'Reference',
-                    clean_text(row[3]) if len(row) > 3 else None,
-                    clean_text(row[4]) if len(row) > 4 else None,
-                    clean_text(row[5]) if len(row) > 5 else None,
-                    row[6] if len(row) > 6 else None,
-                    row[7] if len(row) > 7 else None,
-                    row[8] if len(row) > 8 else None,
-                    row[9] if len(row) > 9 else datetime.now().isoformat()
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  Error importing item: {e}")
-                errors += 1
-                if errors < 5:  # Show first few errors
-                    print(f"  Row data: {row[:3]}...")
-    
-    conn.commit()
-    print(f"  Imported {count} items, {errors} errors")
+def drop_indexes(conn):
+    """Drop secondary indexes before the bulk load, returning their CREATE INDEX statements"""
+    indexes = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in indexes]
 
-def import_links(conn, csv_path):
-    """Import links from CSV (no header row, 3 columns: link_id, source_id, dest_id)"""
-    print(f"\nImporting links from {csv_path}")
-    
-    if not csv_path.exists():
-        print(f"  File not found: {csv_path}")
-        return
-    
-    cursor = conn.cursor()
-    count = 0
-    skipped = 0
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
-            try:
-                if len(row) < 3:
-                    skipped += 1
-                    continue
-                
-                link_id = int(row[0]) if row[0] else None
-                source_id = int(row[1]) if row[1] else None
-                dest_id = int(row[2]) if row[2] else None
-                
-                if link_id and source_id and dest_id:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO links (
-                            link_id, source_item_id, destination_item_id, link_type
-                        ) VALUES (?, ?, ?, ?)
-                    """, (
-                        link_id,
-                        source_id,
-                        dest_id,
-                        'related'
-                    ))
-                    count += 1
-                else:
-                    skipped += 1
-            except Exception as e:
-                print(f"  Error importing link: {e}")
-                skipped += 1
-    
-    conn.commit()
-    print(f"  Imported {count} links, skipped {skipped}")
+def create_indexes(conn, index_sql):
+    """Recreate indexes removed by drop_indexes"""
+    print("\nCreating indexes")
+    for sql in index_sql:
+        conn.execute(sql)
+    print(f"  Created {len(index_sql)} indexes")
 
-def import_cliches(conn, csv_path):
-    """Import cliches from CSV (no header row)"""
-    print(f"\nImporting cliches from {csv_path}")
+def chunked_insert(cursor, sql_prefix, n_cols, rows, chunk=500):
+    """Insert parameter tuples using multi-row VALUES statements of up to `chunk` rows each"""
+    # Stay under SQLite's bound-parameter limit (999 on builds older than 3.32)
+    if hasattr(cursor.connection, 'getlimit'):
+        max_vars = cursor.connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    else:
+        max_vars = 999
+    chunk = max(1, min(chunk, max_vars // n_cols))
+    
+    placeholder = "(" + ", ".join(["?"] * n_cols) + ")"
+    full_sql = f"{sql_prefix} VALUES " + ", ".join([placeholder] * chunk)
+    
+    params = []
+    for row in rows:
+        params.extend(row)
+        if len(params) == chunk * n_cols:
+            cursor.execute(full_sql, params)
+            params = []
+    
+    if params:
+        remaining = len(params) // n_cols
+        cursor.execute(f"{sql_prefix} VALUES " + ", ".join([placeholder] * remaining), params)
+
+def read_csv_rows(csv_path):
+    """Yield the rows of a CSV export as sequences of strings"""
+    # Files are read with universal newlines, so '\r\n' and '\r' inside quoted values
+    # arrive as '\n' - columns that don't go through clean_text rely on this.
+    # 'utf-8-sig' drops a leading byte order mark, as pyarrow does.
+    if pa is not None:
+        with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            first_row = next(csv.reader(f), None)
+        if first_row:
+            rows = _read_csv_arrow(csv_path, len(first_row))
+            if rows is not None:
+                yield from rows
+                return
+    
+    with open(csv_path, 'r', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as f:
+        yield from csv.reader(f)
+
+def _read_csv_arrow(csv_path, n_cols):
+    """Parse a CSV with pyarrow's multithreaded reader, keeping every column as text"""
+    # Returns None whenever pyarrow would not produce exactly the rows csv.reader does,
+    # so the caller reparses the whole file with the csv module and the imported data
+    # never depends on pyarrow being installed.
+    
+    # csv.reader yields [] for a blank line, pyarrow drops it (or, with ignore_empty_lines
+    # off, returns a row of empty strings). Any empty-line sequence sends the file to the
+    # csv module - a blank line inside a quoted value only costs the fast path.
+    with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if any(mm.find(sep) != -1 for sep in (b'\n\n', b'\r\r', b'\n\r')):
+            return None
+    
+    names = [f"c{i}" for i in range(n_cols)]
+    
+    # Rows whose width differs from the first row are rejected by pyarrow; keeping them
+    # in file order would mean merging them back in, so fall back to the csv module
+    odd_rows = []
+    def note_odd_row(invalid_row):
+        odd_rows.append(invalid_row.number)
+        return 'skip'
+    
+    # Memory-map the file so the kernel pages it in for the parser without an extra copy
+    with pa.memory_map(str(csv_path)) as source:
+        table = pacsv.read_csv(
+            source,
+            read_options=pacsv.ReadOptions(column_names=names),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=note_odd_row),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dict.fromkeys(names, pa.string()),
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    if odd_rows:
+        return None
     
-    if not csv_path.exists():
-        print(f"  File not found: {csv_path}")
-        return
+    # pyarrow keeps line endings inside quoted values as they are; match the
+    # universal-newline translation the csv module path gets from open()
+    columns = [
+        pc.replace_substring(pc.replace_substring(column, '\r\n', '\n'), '\r', '\n')
+        for column in table.columns
+    ]
+    return zip(*(column.to_pylist() for column in columns))
+
+class SkipRow(Exception):
+    """Raised by a row parser to skip a CSV row, optionally with a message to print"""
+
+def _as_read(row):
+    """Return a row without the None padding added by parse_csv, for messages"""
+    # The csv readers never produce None, so any trailing Nones are padding
+    n = len(row)
+    while n and row[n - 1] is None:
+        n -= 1
+    return list(row[:n])
+
+def _parse_id(value):
+    """Return a FileMaker ID column as an int, or None if it is not an integer"""
+    # Checked before converting so bad IDs are rejected without int() raising; surrounding
+    # whitespace and a leading sign are accepted, as int() accepts them
+    value = value.strip()
+    digits = value[1:] if value[:1] in ('+', '-') else value
+    return int(value) if digits.isdecimal() else None
+
+def _row_items(row):
+    """Build items params from [id, word, type, definition, derivation, appendicies, source, source_pg, mark, modified_at]"""
+    item_id = int(row[0]) if row[0] else None
+    if not item_id:
+        raise SkipRow("Skipping row with missing ID")
+    
+    # min_cols guarantees all ten columns
+    return (
+        item_id,
+        row[1],
+        row[2],
+        clean_text(row[3]),
+        clean_text(row[4]),
+        clean_text(row[5]),
+        row[6],
+        row[7],
+        row[8],
+        row[9]
+    )
+
+def _row_links(row):
+    """Build links params from [link_id, source_id, dest_id]"""
+    link_id = _parse_id(row[0])
+    source_id = _parse_id(row[1])
+    dest_id = _parse_id(row[2])
     
-    cursor = conn.cursor()
-    count = 0
-    errors = 0
+    # Empty or zero IDs are skipped quietly, anything else that isn't an integer is reported
+    if any(raw and parsed is None for raw, parsed in zip(row, (link_id, source_id, dest_id))):
+        raise SkipRow(f"Skipping link with invalid ID: {list(row[:3])}")
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
-            try:
-                if len(row) < 2:
-                    errors += 1
-                    continue
-                
-                cliche_id = int(row[0]) if row[0] else None
-                if not cliche_id:
-                    errors += 1
-                    continue
-                
-                cursor.execute("""
-                    INSERT OR IGNORE INTO cliches (cliche_id, phrase, definition)
-                    VALUES (?, ?, ?)
-                """, (
-                    cliche_id,
-                    row[1] if len(row) > 1 else '',
-                    clean_text(row[2]) if len(row) > 2 else None
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  Error importing cliche: {e}")
-                errors += 1
+    if not (link_id and source_id and dest_id):
+        raise SkipRow()
     
-    conn.commit()
-    print(f"  Imported {count} cliches, {errors} errors")
+    return (link_id, source_id, dest_id)
 
-def import_names(conn, csv_path):
-    """Import names from CSV (columns: id, name, type, gender)"""
-    print(f"\nImporting names from {csv_path}")
-    
+def _check_links(conn):
+    """Return a check rejecting links whose endpoints are not in the imported items"""
+    item_ids = {item_id for (item_id,) in conn.execute("SELECT item_id FROM items")}
+    
+    def check(params):
+        # A single foreign key failure would abort the whole insert batch,
+        # so links pointing at missing items are filtered out here
+        if params[1] not in item_ids or params[2] not in item_ids:
+            raise SkipRow("Error importing link: FOREIGN KEY constraint failed")
+    return check
+
+def _row_cliches(row):
+    """Build cliches params from [id, phrase, definition]"""
+    cliche_id = int(row[0]) if row[0] else None
+    if not cliche_id:
+        raise SkipRow()
+    
+    return (
+        cliche_id,
+        row[1],
+        clean_text(row[2])
+    )
+
+def _row_names(row):
+    """Build names params from [id, name, type, gender]"""
+    # Example: "1005","Adams","last",""
+    # Example: "3325","Aaron","first","male"
+    if not row[0]:
+        name_id = None
+    else:
+        name_id = _parse_id(row[0])
+        if name_id is None:
+            # Try the old format just in case: [empty, name, id, type]
+            name_id = _parse_id(row[2]) if row[2] else None
+            if name_id is None:
+                raise SkipRow(f"Skipping row with invalid ID: {_as_read(row)}")
+    
+    if not name_id:
+        raise SkipRow()
+    
+    # The file on disk (data/names.csv) is the source of truth, which we verified
+    # is [id, name, type, gender]. Type and gender only take a handful of distinct
+    # values, so share one string object each.
+    return (
+        name_id,
+        row[1],
+        row[2] and sys.intern(row[2]),
+        row[3] and sys.intern(row[3]),
+        None,  # no description in this CSV
+        None   # no notes in this CSV
+    )
+
+def _row_literary_terms(row):
+    """Build literary_terms params from [id, term, definition, examples, notes]"""
+    term_id = int(row[0]) if row[0] else None
+    if not term_id:
+        raise SkipRow()
+    
+    return (
+        term_id,
+        row[1],
+        None, # type
+        clean_text(row[2]),
+        clean_text(row[3]),
+        clean_text(row[4])
+    )
+
+def _row_sources(row):
+    """Build sources params from [author, short_name, title] - no IDs, SQLite assigns source_id"""
+    title = row[2] if row[2] is not None else row[1]
+    author = row[0] if row[0] else None
+    
+    if not title:
+        raise SkipRow()
+    
+    return (
+        title,
+        author,
+        row[1]  # short_name as notes
+    )
+
+# One entry per CSV export, imported in this order. Rows shorter than 'min_cols' are
+# rejected and the rest are padded with None up to 'width' columns, so the row parsers
+# can index columns directly. 'row_fn' returns the params tuple or raises SkipRow, and
+# runs on a worker thread. 'check' (optional) runs on the main thread just before
+# the insert and returns a function that raises SkipRow for params to drop.
+IMPORT_SPECS = [
+    {
+        'name': 'items',
+        'file': 'items.csv',
+        'sql': SQL_INSERT_ITEMS,
+        'n_cols': 10,
+        'min_cols': 10,
+        'width': 10,
+        'row_fn': _row_items,
+    },
+    {
+        'name': 'links',
+        'file': 'links.csv',
+        'sql': SQL_INSERT_LINKS,
+        'n_cols': 3,
+        'min_cols': 3,
+        'width': 3,
+        'row_fn': _row_links,
+        'check': _check_links,
+    },
+    {
+        'name': 'cliches',
+        'file': 'cliches.csv',
+        'sql': SQL_INSERT_CLICHES,
+        'n_cols': 3,
+        'min_cols': 2,
+        'width': 3,
+        'row_fn': _row_cliches,
+    },
+    {
+        'name': 'names',
+        'file': 'names.csv',
+        'sql': SQL_INSERT_NAMES,
+        'n_cols': 6,
+        'min_cols': 2,
+        'width': 4,
+        'row_fn': _row_names,
+    },
+    {
+        'name': 'literary terms',
+        'file': 'literary terms.csv',
+        'sql': SQL_INSERT_LITERARY_TERMS,
+        'n_cols': 6,
+        'min_cols': 2,
+        'width': 5,
+        'row_fn': _row_literary_terms,
+    },
+    {
+        'name': 'sources',
+        'file': 'sources.csv',
+        'sql': SQL_INSERT_SOURCES,
+        'n_cols': 3,
+        'min_cols': 2,
+        'width': 3,
+        'row_fn': _row_sources,
+    },
+]
+
+def parse_csv(csv_path, spec):
+    """Read and validate one CSV export (no header row) - returns (params, errors, messages), or None if missing"""
+    # Runs on a worker thread, so messages are collected for the caller to print in order
     if not csv_path.exists():
-        print(f"  File not found: {csv_path}")
-        return
+        return None
     
-    cursor = conn.cursor()
-    count = 0
+    params = []
     errors = 0
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
-            try:
-                if len(row) < 2:
-                    errors += 1
-                    continue
-                
-                # Columns are: [id, name, type, gender]
-                # Example: "1005","Adams","last",""
-                # Example: "3325","Aaron","first","male"
-                
-                try:
-                    name_id = int(row[0]) if row[0] else None
-                except ValueError:
-                    # Try the old format just in case: [empty, name, id, type]
-                    if len(row) > 2 and row[2].isdigit():
-                         name_id = int(row[2])
-                    else:
-                        print(f"  Skipping row with invalid ID: {row}")
-                        errors += 1
-                        continue
-
-                if not name_id:
-                    errors += 1
-                    continue
-                
-                name = row[1] if len(row) > 1 else ''
-                
-                # Determine type and gender based on format
-                # If parsing as [id, name, type, gender]
-                type_val = row[2] if len(row) > 2 else None
-                gender_val = row[3] if len(row) > 3 else None
-                
-                # If it was the old format [empty, name, id, type], then type is row[3]
-                # But let's assume the file on disk (data/names.csv) is the source of truth
-                # which we verified is [id, name, type, gender]
-                
-                cursor.execute("""
-                    INSERT OR IGNORE INTO names (name_id, name, type, gender, description, notes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    name_id,
-                    name,
-                    type_val,
-                    gender_val,
-                    None,  # no description in this CSV
-                    None   # no notes in this CSV
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  Error importing name: {e}")
-                errors += 1
-    
-    conn.commit()
-    print(f"  Imported {count} names, {errors} errors")
+    messages = []
+    row_fn = spec['row_fn']
+    min_cols = spec['min_cols']
+    width = spec['width']
+    # Singular form for error messages, e.g. "literary terms" -> "literary term"
+    label = spec['name'][:-1]
+    
+    for row in read_csv_rows(csv_path):
+        n = len(row)
+        if n < min_cols:
+            errors += 1
+            continue
+        if n < width:
+            row = [*row, *([None] * (width - n))]
+        try:
+            params.append(row_fn(row))
+        except SkipRow as e:
+            errors += 1
+            if e.args and len(messages) < MAX_ERROR_SAMPLES:
+                messages.append(str(e))
+        except Exception as e:
+            errors += 1
+            if len(messages) < MAX_ERROR_SAMPLES:
+                messages.append(f"Error importing {label}: {e} - row data: {list(row[:min(n, 3)])}...")
+    
+    return params, errors, messages
 
-def import_literary_terms(conn, csv_path):
-    """Import literary terms from CSV (no header row)"""
-    print(f"\nImporting literary terms from {csv_path}")
+def import_csv(conn, csv_path, spec, parsed):
+    """Insert rows returned by parse_csv using spec['sql']"""
+    print(f"\nImporting {spec['name']} from {csv_path}")
     
-    if not csv_path.exists():
+    if parsed is None:
         print(f"  File not found: {csv_path}")
         return
     
-    cursor = conn.cursor()
-    count = 0
-    errors = 0
+    params, errors, messages = parsed
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
+    if 'check' in spec:
+        check = spec['check'](conn)
+        kept = []
+        for row_params in params:
             try:
-                if len(row) < 2:
-                    errors += 1
-                    continue
-                
-                term_id = int(row[0]) if row[0] else None
-                if not term_id:
-                    errors += 1
-                    continue
-                
-                cursor.execute("""
-                    INSERT OR IGNORE INTO literary_terms (term_id, term, type, definition, examples, notes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    term_id,
-                    row[1] if len(row) > 1 else '',
-                    None, # type
-                    clean_text(row[2]) if len(row) > 2 else None,
-                    clean_text(row[3]) if len(row) > 3 else None,
-                    clean_text(row[4]) if len(row) > 4 else None
-                ))
-                count += 1
-            except Exception as e:
-                print(f"  Error importing literary term: {e}")
+                check(row_params)
+            except SkipRow as e:
                 errors += 1
+                if len(messages) < MAX_ERROR_SAMPLES:
+                    messages.append(str(e))
+                continue
+            kept.append(row_params)
+        params = kept
     
-    conn.commit()
-    print(f"  Imported {count} literary terms, {errors} errors")
-
-def import_sources(conn, csv_path):
-    """Import sources from CSV (columns: author, short_name, title - no IDs)"""
-    print(f"\nImporting sources from {csv_path}")
-    
-    if not csv_path.exists():
-        print(f"  File not found: {csv_path}")
-        return
-    
-    cursor = conn.cursor()
-    count = 0
-    errors = 0
-    source_id = 1000  # Start IDs at 1000
+    for message in messages:
+        print(f"  {message}")
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        for row in reader:
-            try:
-                if len(row) < 2:
-                    errors += 1
-                    continue
-                
-                # Columns are: [author, short_name, title]
-                title = row[2] if len(row) > 2 else row[1] if len(row) > 1 else ''
-                author = row[0] if row[0] else None
-                
-                if not title:
-                    errors += 1
-                    continue
-                
-                cursor.execute("""
-                    INSERT OR IGNORE INTO sources (source_id, title, author, notes)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    source_id,
-                    title,
-                    author,
-                    row[1] if len(row) > 1 else None  # short_name as notes
-                ))
-                source_id += 1
-                count += 1
-            except Exception as e:
-                print(f"  Error importing source: {e}")
-                errors += 1
+    chunked_insert(conn.cursor(), spec['sql'], spec['n_cols'], params)
     
-    conn.commit()
-    print(f"  Imported {count} sources, {errors} errors")
+    print(f"  Imported {len(params)} {spec['name']}, {errors} errors")
 
 def print_statistics(conn):
     """Print database statistics"""
@@ -366,10 +467,10 @@ def print_statistics(conn):
     
     cursor = conn.cursor()
     
+    # One statement for all the counts rather than a query per table
     tables = ['items', 'links', 'cliches', 'names', 'literary_terms', 'sources']
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
+    cursor.execute(" UNION ALL ".join(f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables))
+    for table, count in cursor.fetchall():
         print(f"  {table:20} {count:>10,}")
 
 def main():
@@ -382,17 +483,24 @@ def main():
     if not conn:
         return
     
-    # Import data (using actual filenames from your export)
-    import_items(conn, DATA_DIR / "items.csv")
-    import_links(conn, DATA_DIR / "links.csv")
-    import_cliches(conn, DATA_DIR / "cliches.csv")
-    import_names(conn, DATA_DIR / "names.csv")
-    import_literary_terms(conn, DATA_DIR / "literary terms.csv")
-    import_sources(conn, DATA_DIR / "sources.csv")
+    # Indexes are built once after the data is loaded
+    index_sql = drop_indexes(conn)
+    
+    # Import data (using actual filenames from your export). The files are independent,
+    # so they are parsed concurrently; inserts stay on this thread as SQLite has a single writer.
+    with ThreadPoolExecutor(max_workers=len(IMPORT_SPECS)) as pool:
+        parsed = [pool.submit(parse_csv, DATA_DIR / spec['file'], spec) for spec in IMPORT_SPECS]
+        for spec, future in zip(IMPORT_SPECS, parsed):
+            import_csv(conn, DATA_DIR / spec['file'], spec, future.result())
+    
+    create_indexes(conn, index_sql)
+    conn.commit()
     
     # Print statistics
     print_statistics(conn)
     
+    # Write the finished database out as a compact file (needs SQLite 3.27+)
+    conn.execute("VACUUM INTO ?", (str(DB_PATH),))
     conn.close()
     print(f"\nDatabase created successfully at: {DB_PATH}")
 